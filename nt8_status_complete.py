@@ -62,20 +62,41 @@ DEFAULT_PATTERNS = {
     },
 }
 
-import os, re, json, time, socket, threading
+import os, re, sys, json, mmap, time, atexit, fnmatch, select, signal, socket, functools, threading
 from pathlib import Path
-from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass
+from datetime import datetime
+
+try:
+    import orjson  # optional; faster snapshot encoding when installed
+except ImportError:
+    orjson = None
 
 APP_NAME = "NT8 Strategy Status Watcher"
 HOME = Path.home()
 NT8_LOG_DIR = HOME / "Documents" / "NinjaTrader 8" / "log"
+# Cap on distinct (name, instrument) entries recovered for the initial snapshot
+MAX_STRATEGIES = 200
 
 # Valid instrument helpers
 _MONTHS = "JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC"
-_RE_FUT_MMMYY = re.compile(rf"^[A-Z]{{1,6}}\s+(?:{_MONTHS})\s?\d{{2}}$")
-_RE_FUT_MMYY = re.compile(r"^[A-Z]{1,6}\s+\d{2}-\d{2}$")  # e.g., ES 03-26
-_RE_SYMBOL = re.compile(r"^[A-Z]{1,6}$")  # equities/forex symbol
+# Use with fullmatch(): futures MMMYY (MNQ DEC25), futures MM-YY (ES 03-26),
+# or a bare equities/forex symbol (AAPL).
+_RE_VALID_INSTRUMENT = re.compile(
+    rf"[A-Z]{{1,6}}\s+(?:{_MONTHS})\s?\d{{2}}"
+    r"|[A-Z]{1,6}\s+\d{2}-\d{2}"
+    r"|[A-Z]{1,6}"
+)
+
+# Literal prefilter for the status patterns: a line must contain at least one
+# literal from each group before any enabled/disabled regex is tried. Every
+# DEFAULT_PATTERNS enabled/disabled regex requires one literal of each group
+# (never inside an alternation, optional group or character class); custom
+# patterns give no such guarantee, so the prefilter is only used for these.
+_PREFILTER_GROUPS = (("strateg", "ninjascript"), ("enabl", "disabl"))
+
+# Leading log timestamp, e.g. "2025-11-22 13:45:12:123|" or "2025-11-22 13:45:12:123 "
+_RE_LOG_PREFIX = re.compile(r"\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:[:.,]\d{1,6})?[\s|]*")
 
 DEFAULT_CONFIG = {
     "email": {
@@ -102,10 +123,22 @@ DEFAULT_CONFIG = {
         "match_strategies": [],
         "status_json_path": str(Path(__file__).with_name("nt8_strategy_status.json")),
         "email_on_change": False,
+        "snapshot_min_interval_sec": 0.5,
+        "snapshot_fsync": False,
         "patterns": DEFAULT_PATTERNS,
     },
 }
 
+def build_prefilter(enabled_pats: list, disabled_pats: list):
+    """
+    Return the literal groups to prefilter lines with, or None (no line is
+    skipped) unless the status patterns are exactly the built-in
+    DEFAULT_PATTERNS ones.
+    """
+    if enabled_pats != DEFAULT_PATTERNS["enabled"] or disabled_pats != DEFAULT_PATTERNS["disabled"]:
+        return None
+    return _PREFILTER_GROUPS
+
 def load_config() -> dict:
     cfg_path = Path(__file__).with_name("config.json")
     if not cfg_path.exists():
@@ -153,24 +186,119 @@ def send_email(cfg_email: dict, subject: str, body: str):
             server.sendmail(cfg_email["from_addr"], cfg_email["to_addrs"], msg.encode("utf-8"))
 
 def newest_log_file(log_dir: Path):
-    cands = sorted(Path(log_dir).glob("log*.txt"), key=lambda p: p.stat().st_mtime, reverse=True)
-    if cands:
-        return cands[0]
-    cands = sorted(Path(log_dir).glob("log*"), key=lambda p: p.stat().st_mtime, reverse=True)
-    return cands[0] if cands else None
+    # scandir entries carry cached stat data on Windows, so picking the newest
+    # file needs no extra syscall per candidate there.
+    try:
+        with os.scandir(log_dir) as it:
+            cands = [e for e in it if fnmatch.fnmatch(e.name, "log*")]
+    except OSError:
+        return None
+    mtime = lambda e: e.stat().st_mtime
+    newest = max((e for e in cands if fnmatch.fnmatch(e.name, "log*.txt")), key=mtime, default=None)
+    if newest is None:
+        newest = max(cands, key=mtime, default=None)
+    return Path(newest.path) if newest else None
 
 def now_str():
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
+def utc_iso_now() -> str:
+    """Current UTC time in ISO 8601 with microseconds, e.g. 2025-11-22T13:45:12.123456+00:00."""
+    now = time.time()
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)) + f".{int(now % 1 * 1_000_000):06d}+00:00"
+
+class DirWatcher:
+    """
+    Minimal Linux inotify watch on a directory (via ctypes, no extra
+    dependency) so the tailer can sleep until something in the log folder
+    changes instead of polling. Use DirWatcher.create(), which returns None
+    where inotify is unavailable; callers then keep polling.
+    """
+    IN_MODIFY = 0x00000002
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+
+    def __init__(self, fd: int):
+        self.fd = fd
+
+    @classmethod
+    def create(cls, path: Path):
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            import ctypes, ctypes.util
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return None
+            mask = cls.IN_MODIFY | cls.IN_CREATE | cls.IN_MOVED_TO
+            if libc.inotify_add_watch(fd, os.fsencode(str(path)), mask) < 0:
+                os.close(fd)
+                return None
+            return cls(fd)
+        except Exception:
+            return None
+
+    def wait(self, timeout: float):
+        """Block until the directory reports events (or timeout), then drain them."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return
+        while True:
+            try:
+                data = os.read(self.fd, 4096)
+            except BlockingIOError:
+                return
+            if not data:
+                return
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
 class SimpleTailer:
     def __init__(self, log_dir: Path, interval: float):
         self.log_dir = Path(log_dir)
         self.interval = interval
         self.current = None
         self.fh = None
+        self._buf = bytearray()  # bytes read past the last complete line
+        self.watcher = DirWatcher.create(self.log_dir)
+        # newest_log_file() result, reused while the directory mtime is unchanged
+        self._dir_mtime_cache = None
+        self._latest_cache = None
+
+    def wait(self):
+        if self.watcher:
+            # Events wake us immediately; the timeout keeps polling latency as
+            # the worst case for writes inotify never sees (e.g. SMB or WSL
+            # /mnt/c mounts of the Windows log folder).
+            self.watcher.wait(self.interval)
+        else:
+            time.sleep(self.interval)
+
+    def latest_log_file(self):
+        """
+        newest_log_file(), skipped while the log folder's mtime is unchanged:
+        NT8 only adds files on rotation, which bumps the directory mtime.
+        """
+        try:
+            dir_mtime = self.log_dir.stat().st_mtime_ns
+        except OSError:
+            self._dir_mtime_cache = None
+            return None
+        if dir_mtime == self._dir_mtime_cache:
+            return self._latest_cache
+        self._latest_cache = newest_log_file(self.log_dir)
+        # Directory timestamps can be coarse: a file created within the same
+        # tick would not move the mtime again, so only trust settled values.
+        settled = time.time_ns() - dir_mtime > 2_000_000_000
+        self._dir_mtime_cache = dir_mtime if settled else None
+        return self._latest_cache
 
     def open_latest(self):
-        latest = newest_log_file(self.log_dir)
+        latest = self.latest_log_file()
         if latest and latest != self.current:
             if self.fh:
                 try:
@@ -178,26 +306,57 @@ class SimpleTailer:
                 except Exception:
                     pass
             self.current = latest
-            self.fh = open(latest, "r", encoding="utf-8", errors="ignore")
+            self.fh = open(latest, "rb", buffering=0)
             self.fh.seek(0, os.SEEK_END)
+            self._buf.clear()
+
+    def close(self):
+        """Release the open log file and the inotify watch."""
+        if self.fh:
+            try:
+                self.fh.close()
+            except Exception:
+                pass
+            self.fh = None
+            self.current = None
+        if self.watcher:
+            self.watcher.close()
+            self.watcher = None
 
     def lines(self):
-        while True:
-            self.open_latest()
-            if not self.fh:
-                time.sleep(self.interval)
-                continue
-            line = self.fh.readline()
-            if not line:
-                time.sleep(self.interval)
-                continue
-            yield line.rstrip("\r\n")
+        try:
+            while True:
+                self.open_latest()
+                if not self.fh:
+                    self.wait()
+                    continue
+                chunk = os.read(self.fh.fileno(), 65536)
+                if not chunk:
+                    self.wait()
+                    continue
+                self._buf += chunk
+                end = self._buf.rfind(b"\n")
+                if end < 0:
+                    continue
+                complete = bytes(self._buf[:end])
+                del self._buf[:end + 1]
+                for line in complete.split(b"\n"):
+                    yield line.decode("utf-8", errors="ignore").rstrip("\r")
+        finally:
+            # Runs when the consumer stops iterating (exception, close() or GC).
+            self.close()
+
+def compile_match_strategies(subs):
+    """Casefold match_strategies substrings once for requires_any, or None if unset."""
+    if not subs:
+        return None
+    return [s.casefold() for s in subs]
 
 def requires_any(text: str, subs):
     if not subs:
         return True
-    low = text.lower()
-    return any(s.lower() in low for s in subs)
+    low = text.casefold()
+    return any(s in low for s in subs)
 
 @dataclass
 class StrategyStatus:
@@ -207,74 +366,188 @@ class StrategyStatus:
     connection: str
     account: str = ""
 
-def parse_with_patterns(line: str, patterns: dict):
+class PatternEngine:
     """
-    Try the configured enabled/disabled patterns, returning a tuple:
-      (matched: bool, status_dict: dict)
-    status_dict keys: name, instrument, enabled, connection, account(optional)
+    Status-line parser built once from a patterns config (see
+    DEFAULT_PATTERNS). Holds the compiled enabled/disabled/extractor
+    regexes and the literal prefilter, so the per-line path only does
+    attribute lookups.
+    """
+    def __init__(self, patterns: dict):
+        self.enabled = [re.compile(p, re.IGNORECASE) for p in patterns.get("enabled", [])]
+        self.disabled = [re.compile(p, re.IGNORECASE) for p in patterns.get("disabled", [])]
+        # Extractors that do not capture their field could never fill it; drop them up front.
+        self.extractors = {}
+        for field, pats in patterns.get("extractors", {}).items():
+            compiled = [re.compile(p, re.IGNORECASE) for p in pats]
+            self.extractors[field] = [pat for pat in compiled if field in pat.groupindex]
+        self.prefilter = build_prefilter(patterns.get("enabled", []), patterns.get("disabled", []))
+        # Memoized on the message after the timestamp (built-in patterns only):
+        # whole lines never repeat, but the same status message does (e.g. a
+        # strategy re-enabled).
+        self._parse_cached = functools.lru_cache(maxsize=4096)(self._parse_uncached)
+
+    def passes_prefilter(self, line: str) -> bool:
+        """Cheap substring test deciding whether any status pattern can match the line."""
+        if not self.prefilter:
+            return True
+        # lower() + 'in' is several times faster here than IGNORECASE regex scans.
+        low = line.lower()
+        return all(any(tok in low for tok in group) for group in self.prefilter)
+
+    def parse(self, line: str):
+        """
+        Match a log line against the status patterns and fill in missing
+        fields. Returns a fresh status dict (keys: name, instrument, enabled,
+        connection, account(optional)), or None if the line is not a
+        strategy status line.
+        """
+        if not self.prefilter:
+            # Custom patterns may anchor on the timestamp prefix, and without the
+            # prefilter noise lines would flood the cache: parse the full line.
+            parsed = self._parse_uncached(line)
+            return dict(parsed) if parsed is not None else None
+        # Keep unrelated lines out of the cache so they cannot evict real hits.
+        if not self.passes_prefilter(line):
+            return None
+        prefix = _RE_LOG_PREFIX.match(line)
+        cached = self._parse_cached(line[prefix.end():] if prefix else line)
+        return dict(cached) if cached is not None else None
+
+    def _parse_uncached(self, line: str):
+        matched, status = self.match_status(line)
+        if not matched:
+            return None
+        return tuple(self.fill_missing_fields(line, status).items())
+
+    def match_status(self, line: str):
+        """
+        Try the enabled/disabled patterns, returning a tuple:
+          (matched: bool, status_dict: dict)
+        """
+        for pat in self.enabled:
+            m = pat.search(line)
+            if m:
+                gd = {k: (m.group(k) or "").strip() for k in ("name", "instrument", "connection") if k in m.re.groupindex}
+                # Normalize names like 'Foo/12345' -> 'Foo'
+                if "name" in gd and "/" in gd["name"]:
+                    gd["name"] = gd["name"].split("/", 1)[0]
+                status = {"enabled": True, **gd}
+                return True, status
+
+        for pat in self.disabled:
+            m = pat.search(line)
+            if m:
+                gd = {k: (m.group(k) or "").strip() for k in ("name", "instrument", "connection") if k in m.re.groupindex}
+                if "name" in gd and "/" in gd["name"]:
+                    gd["name"] = gd["name"].split("/", 1)[0]
+                status = {"enabled": False, **gd}
+                return True, status
+
+        return False, {}
+
+    def fill_missing_fields(self, line: str, status: dict):
+        """Use extractor patterns to fill any missing fields."""
+        missing = [f for f in ("name", "instrument", "connection", "account") if not status.get(f)]
+        for field in missing:
+            for pat in self.extractors.get(field, []):
+                m = pat.search(line)
+                if m:
+                    status[field] = (m.group(field) or "").strip()
+                    break
+        # Sanity trims
+        for k in ("name", "instrument", "connection", "account"):
+            if k in status and isinstance(status[k], str):
+                status[k] = status[k].strip(" :;,-[]()")
+        # Validate instrument to avoid false positives like bare years (e.g., "2025")
+        if status.get("instrument"):
+            if not _RE_VALID_INSTRUMENT.fullmatch(status["instrument"]):
+                status["instrument"] = ""
+        return status
+
+def dumps_json(data) -> bytes:
+    """Pretty-printed UTF-8 JSON, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+def atomic_write_json(path: Path, data: dict, fsync: bool = False):
+    """
+    Replace path with data atomically. Readers rely on os.replace() never
+    exposing a partial file, not on durability: by default the write is left
+    to OS write-back. fsync=True also flushes the file (and, where possible,
+    its directory) to disk, at the cost of blocking until the disk commits.
     """
-    low = line.lower()
-
-    for pat in patterns.get("enabled", []):
-        m = re.search(pat, low, re.IGNORECASE)
-        if m:
-            gd = {k: (m.group(k) or "").strip() for k in ("name", "instrument", "connection") if k in m.groupdict()}
-            # Normalize names like 'Foo/12345' -> 'Foo'
-            if "name" in gd and "/" in gd["name"]:
-                gd["name"] = gd["name"].split("/", 1)[0]
-            status = {"enabled": True, **gd}
-            return True, status
-
-    for pat in patterns.get("disabled", []):
-        m = re.search(pat, low, re.IGNORECASE)
-        if m:
-            gd = {k: (m.group(k) or "").strip() for k in ("name", "instrument", "connection") if k in m.groupdict()}
-            if "name" in gd and "/" in gd["name"]:
-                gd["name"] = gd["name"].split("/", 1)[0]
-            status = {"enabled": False, **gd}
-            return True, status
-
-    return False, {}
-
-def fill_missing_fields(line: str, status: dict, patterns: dict):
-    """Use extractor patterns to fill any missing fields."""
-    low = line.lower()
-    extractors = patterns.get("extractors", {})
-    for field in ("name", "instrument", "connection", "account"):
-        if status.get(field):
-            continue
-        for pat in extractors.get(field, []):
-            m = re.search(pat, low, re.IGNORECASE)
-            if m and field in m.groupdict():
-                status[field] = (m.group(field) or "").strip()
-                break
-    # Sanity trims
-    for k in ("name", "instrument", "connection", "account"):
-        if k in status and isinstance(status[k], str):
-            status[k] = status[k].strip(" :;,-[]()")
-    # Validate instrument to avoid false positives like bare years (e.g., "2025")
-    if status.get("instrument"):
-        if not (
-            _RE_FUT_MMMYY.match(status["instrument"])
-            or _RE_FUT_MMYY.match(status["instrument"])
-            or _RE_SYMBOL.match(status["instrument"])
-        ):
-            status["instrument"] = ""
-    return status
-
-def atomic_write_json(path: Path, data: dict):
     path = Path(path)
     tmp = path.with_suffix(path.suffix + ".tmp")
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open(tmp, "wb") as f:
+        f.write(dumps_json(data))
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
     os.replace(tmp, path)
+    if fsync and hasattr(os, "O_DIRECTORY"):
+        # Persist the rename itself (POSIX only; directories cannot be opened on Windows).
+        dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
 
 def statuses_to_json(statuses: dict) -> dict:
     return {
         "updated_at": datetime.now().isoformat(timespec="seconds"),
-        "strategies": [asdict(s) for s in sorted(statuses.values(), key=lambda s: (s.name.lower(), s.instrument.lower()))],
+        "strategies": [
+            {"name": s.name, "instrument": s.instrument, "enabled": s.enabled, "connection": s.connection, "account": s.account}
+            for s in sorted(statuses.values(), key=lambda s: (s.name.lower(), s.instrument.lower()))
+        ],
     }
 
+class StatusSnapshotWriter:
+    """
+    Writes the status JSON snapshot at most once per min_interval seconds.
+    Changes arriving within the interval are coalesced into one trailing
+    write from a timer thread, so the last change of a burst always lands.
+    flush() writes anything pending right away (used on shutdown).
+    """
+    def __init__(self, path: Path, min_interval: float, fsync: bool = False):
+        self.path = path
+        self.min_interval = min_interval
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._pending = None  # copy of statuses awaiting a write
+        self._last_write = float("-inf")
+        self._timer = None
+
+    def submit(self, statuses: dict):
+        with self._lock:
+            self._pending = dict(statuses)
+            delay = self._last_write + self.min_interval - time.monotonic()
+            if delay <= 0:
+                self._write_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        with self._lock:
+            self._write_locked()
+
+    def _write_locked(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending is None:
+            return
+        statuses, self._pending = self._pending, None
+        try:
+            atomic_write_json(self.path, statuses_to_json(statuses), fsync=self.fsync)
+            print(f"Status JSON updated ({len(statuses)} strategies).")
+        except Exception as e:
+            print(f"[error] Failed to write status JSON: {e}")
+        self._last_write = time.monotonic()
+
 def get_env_or_config(cfg: dict, env_name: str, path_in_cfg, default=None):
     """
     Look up value from environment first, otherwise from nested config path.
@@ -299,7 +572,17 @@ class SupabaseStrategyPublisher:
     """
     Minimal REST publisher using standard library only.
     Uses a Supabase API key (service role or anon) via env/config for upserts.
+    Rows are upserted in batches by a background thread, so network latency
+    never blocks the log tailer.
     """
+    # After the first pending row, wait this long for more before posting
+    BATCH_INTERVAL = 0.5
+    # Rows per POST at most
+    MAX_BATCH = 100
+    # Delay before retrying a failed POST, doubling per failure up to the max
+    RETRY_MIN = 1.0
+    RETRY_MAX = 60.0
+
     def __init__(self, cfg: dict):
         self.url = get_env_or_config(cfg, "SUPABASE_URL", ["supabase", "url"], "")
         self.service_key = get_env_or_config(cfg, "SUPABASE_SERVICE_ROLE_KEY", ["supabase", "service_role_key"], "")
@@ -314,6 +597,19 @@ class SupabaseStrategyPublisher:
             print("[warn] Supabase URL not configured; publishing disabled.")
         if not self.service_key:
             print("[warn] Supabase API key not configured; publishing disabled.")
+        # Latest unsent row per (strategy_name, instrument). Only the newest
+        # state matters for the table, so the backlog is bounded by the number
+        # of distinct strategies and a newer row simply replaces an older one.
+        # This also keeps each batch free of duplicate conflict keys, which
+        # PostgREST rejects in a bulk upsert.
+        self._pending = {}
+        self._cond = threading.Condition()
+        self._closing = False
+        self._worker = None
+        self._conn = None  # kept-alive HTTP(S) connection, used by the worker only
+        if self.is_configured():
+            self._worker = threading.Thread(target=self._run, name="supabase-publisher", daemon=True)
+            self._worker.start()
 
     def _build_table_endpoint(self, table_name: str) -> str:
         base = self.url.rstrip("/")
@@ -333,65 +629,162 @@ class SupabaseStrategyPublisher:
             "instrument": norm_instrument,
             "enabled": bool(enabled),
             "connection": norm_connection,
-            "updated_at": datetime.now(timezone.utc).isoformat()
         }
-        data = json.dumps(payload).encode("utf-8")
+        with self._cond:
+            self._pending[(strategy_name, norm_instrument)] = payload
+            self._cond.notify()
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Post any pending rows and stop the background thread."""
+        if self._worker is None:
+            return
+        with self._cond:
+            self._closing = True
+            self._cond.notify()
+        self._worker.join(timeout)
+        self._worker = None
+
+    def _drain(self):
+        """
+        Wait for a pending row, then let more accumulate for up to
+        BATCH_INTERVAL or MAX_BATCH rows. Returns (rows, stopping).
+        """
+        with self._cond:
+            while not self._pending and not self._closing:
+                self._cond.wait()
+            deadline = time.monotonic() + self.BATCH_INTERVAL
+            while not self._closing and len(self._pending) < self.MAX_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            keys = list(self._pending)[:self.MAX_BATCH]
+            rows = [self._pending.pop(k) for k in keys]
+            return rows, self._closing and not self._pending
+
+    def _run(self):
+        backoff = 0.0
+        while True:
+            rows, stopping = self._drain()
+            if rows and not self._post(rows):
+                with self._cond:
+                    if self._closing:
+                        print(f"[warn] Supabase publisher stopping; {len(rows) + len(self._pending)} row(s) not sent.")
+                        return
+                    # Put the rows back for the next attempt; a newer row that
+                    # arrived meanwhile for the same key still wins.
+                    for r in rows:
+                        self._pending.setdefault((r["strategy_name"], r["instrument"]), r)
+                    backoff = min(backoff * 2 or self.RETRY_MIN, self.RETRY_MAX)
+                    self._cond.wait_for(lambda: self._closing, backoff)
+                continue
+            backoff = 0.0
+            if stopping:
+                return
+
+    def _post(self, rows: list) -> bool:
+        """POST one batch; returns True if the server accepted it."""
+        updated_at = utc_iso_now()
+        for r in rows:
+            r["updated_at"] = updated_at
+        data = json.dumps(rows).encode("utf-8")
         try:
-            import urllib.request
-            req = urllib.request.Request(
-                self.rest_endpoint,
-                data=data,
-                method="POST",
-                headers={
-                    "Content-Type": "application/json",
-                    "apikey": self.service_key,
-                    "Authorization": f"Bearer {self.service_key}",
-                    "Prefer": "resolution=merge-duplicates",
-                },
-            )
+            import http.client
             if self.debug:
-                print(f"[supabase] POST {self.rest_endpoint} payload={payload}")
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                # 201 Created or 204 No Content are typical
-                if resp.status not in (200, 201, 204):
-                    body = resp.read().decode("utf-8", errors="ignore")
-                    print(f"[warn] Supabase upsert unexpected status: {resp.status} body={body}")
+                print(f"[supabase] POST {self.rest_endpoint} rows={rows}")
+            try:
+                status, body = self._send(data)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # The server closed the idle keep-alive connection; reconnect once.
+                # Timeouts are not retried: a slow server would just block twice.
+                self._close_connection()
+                status, body = self._send(data)
+            # 201 Created or 204 No Content are typical
+            if status not in (200, 201, 204):
+                print(f"[warn] Supabase upsert unexpected status: {status} body={body.decode('utf-8', errors='ignore')}")
+                return False
+            return True
         except Exception as e:
+            self._close_connection()
             print(f"[error] Supabase upsert failed: {e}")
-
-def _read_last_lines(path: Path, max_bytes: int = 2_000_000) -> list:
+            return False
+
+    def _send(self, data: bytes):
+        """POST data to the table endpoint over a reused connection; returns (status, body)."""
+        import http.client
+        from urllib.parse import urlsplit
+        endpoint = urlsplit(self.rest_endpoint)
+        if self._conn is None:
+            conn_cls = http.client.HTTPSConnection if endpoint.scheme == "https" else http.client.HTTPConnection
+            self._conn = conn_cls(endpoint.netloc, timeout=10)
+        self._conn.request(
+            "POST",
+            f"{endpoint.path}?{endpoint.query}",
+            body=data,
+            headers={
+                "Content-Type": "application/json",
+                "apikey": self.service_key,
+                "Authorization": f"Bearer {self.service_key}",
+                "Prefer": "resolution=merge-duplicates",
+            },
+        )
+        resp = self._conn.getresponse()
+        # Read the whole body so the connection can carry the next request.
+        return resp.status, resp.read()
+
+    def _close_connection(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+def iter_last_lines_reversed(path: Path, max_bytes: int = 2_000_000):
     """
-    Efficiently read the last max_bytes of a text file and split into lines.
-    Decoded as UTF-8 with errors ignored.
+    Yield the lines in the last max_bytes of a text file, newest first.
+    Only the tail of the file is memory-mapped and each line is decoded as
+    UTF-8 (errors ignored) only when reached, so callers that stop early
+    skip the rest.
     """
     try:
         with open(path, "rb") as fb:
-            fb.seek(0, os.SEEK_END)
-            size = fb.tell()
-            fb.seek(max(0, size - max_bytes), os.SEEK_SET)
-            data = fb.read()
-        return data.decode("utf-8", errors="ignore").splitlines()
-    except Exception:
-        return []
+            size = os.fstat(fb.fileno()).st_size
+            if size == 0:
+                return  # mmap cannot map an empty file
+            # mmap offsets must be a multiple of the allocation granularity.
+            tail_start = max(0, size - max_bytes)
+            offset = tail_start - tail_start % mmap.ALLOCATIONGRANULARITY
+            with mmap.mmap(fb.fileno(), size - offset, offset=offset, access=mmap.ACCESS_READ) as data:
+                end = len(data)
+                start = tail_start - offset
+                while end > start:
+                    nl = data.rfind(b"\n", start, end)
+                    yield data[nl + 1 if nl >= 0 else start:end].decode("utf-8", errors="ignore").rstrip("\r")
+                    end = nl if nl >= 0 else start
+    except Exception as e:
+        print(f"[error] Failed to read log tail {path}: {e}")
+        return
 
-def build_initial_statuses(log_dir: Path, patterns: dict, match_strategies) -> dict:
+def build_initial_statuses(log_dir: Path, engine: PatternEngine, strategy_filter) -> dict:
     """
     Parse the tail of the current newest log file to reconstruct the
     latest known status for each strategy. Returns a dict of StrategyStatus.
+    Lines are walked newest-first, so the first status seen for a key is
+    the latest one and older lines for it are ignored.
     """
     latest = newest_log_file(log_dir)
     statuses = {}
     if not latest:
         return statuses
-    for raw_line in _read_last_lines(latest):
+    for raw_line in iter_last_lines_reversed(latest):
         if not raw_line:
             continue
-        if match_strategies and not requires_any(raw_line, match_strategies):
+        if not requires_any(raw_line, strategy_filter):
             continue
-        matched, status = parse_with_patterns(raw_line, patterns)
-        if not matched:
+        status = engine.parse(raw_line)
+        if status is None:
             continue
-        status = fill_missing_fields(raw_line, status, patterns)
         if not status.get("name"):
             continue
         name = status.get("name", "")
@@ -400,6 +793,8 @@ def build_initial_statuses(log_dir: Path, patterns: dict, match_strategies) -> d
         enabled = bool(status.get("enabled"))
         account = status.get("account", "")
         key = (name, instrument or "")
+        if key in statuses:
+            continue
         statuses[key] = StrategyStatus(
             name=name,
             instrument=instrument,
@@ -407,6 +802,8 @@ def build_initial_statuses(log_dir: Path, patterns: dict, match_strategies) -> d
             connection=connection,
             account=account,
         )
+        if len(statuses) >= MAX_STRATEGIES:
+            break
     return statuses
 
 def run_strategy_status_monitor(cfg: dict):
@@ -414,16 +811,24 @@ def run_strategy_status_monitor(cfg: dict):
     log_dir = Path(watch["log_dir"]).expanduser()
     interval = watch["poll_interval_sec"]
     cooldown_min = watch["cooldown_min"]
-    match_strategies = watch.get("match_strategies", [])
+    strategy_filter = compile_match_strategies(watch.get("match_strategies", []))
     status_json_path = Path(watch["status_json_path"]).expanduser()
-    patterns = watch.get("patterns", DEFAULT_PATTERNS)
+    engine = PatternEngine(watch.get("patterns", DEFAULT_PATTERNS))
     email_on_change = bool(watch.get("email_on_change", False))
 
     statuses = {}  # key: (name, instrument) -> StrategyStatus
     tailer = SimpleTailer(log_dir, interval)
-    last_json_write = None
+    writer = StatusSnapshotWriter(
+        status_json_path,
+        float(watch.get("snapshot_min_interval_sec", 0.5)),
+        fsync=bool(watch.get("snapshot_fsync", False)),
+    )
     last_email_time = None
     publisher = SupabaseStrategyPublisher(cfg)
+    # atexit runs handlers last-in-first-out: register the publisher first so
+    # the local snapshot is flushed before close() can block on the network.
+    atexit.register(publisher.close)
+    atexit.register(writer.flush)
 
     print(f"{APP_NAME} starting...")
     print(f"Watching logs in: {log_dir}")
@@ -431,27 +836,25 @@ def run_strategy_status_monitor(cfg: dict):
 
     # Initial snapshot: parse current log tail and publish immediately
     try:
-        initial = build_initial_statuses(log_dir, patterns, match_strategies)
+        initial = build_initial_statuses(log_dir, engine, strategy_filter)
         statuses.update(initial)
-        atomic_write_json(status_json_path, statuses_to_json(statuses))
-        last_json_write = datetime.now()
-        print(f"Initial status JSON written ({len(statuses)} strategies).")
+        print(f"Initial snapshot built ({len(statuses)} strategies).")
     except Exception as e:
         print(f"[error] Failed to build initial snapshot: {e}")
+    writer.submit(statuses)
 
     for raw_line in tailer.lines():
         try:
             if not raw_line:
                 continue
-            if match_strategies and not requires_any(raw_line, match_strategies):
+            if not requires_any(raw_line, strategy_filter):
                 continue
 
-            matched, status = parse_with_patterns(raw_line, patterns)
-            if not matched:
+            status = engine.parse(raw_line)
+            if status is None:
                 # Not a strategy status line; skip quietly.
                 continue
 
-            status = fill_missing_fields(raw_line, status, patterns)
             if not status.get("name"):
                 # If we still cannot identify the strategy name, log and continue.
                 print(f"[warn] Could not determine strategy name from line:\n  {raw_line}")
@@ -463,7 +866,7 @@ def run_strategy_status_monitor(cfg: dict):
             enabled = bool(status.get("enabled"))
             account = status.get("account", "")
             # Normalize instrument post-extraction as well
-            if instrument and not (_RE_FUT_MMMYY.match(instrument) or _RE_FUT_MMYY.match(instrument) or _RE_SYMBOL.match(instrument)):
+            if instrument and not _RE_VALID_INSTRUMENT.fullmatch(instrument):
                 instrument = ""
             key = (name, instrument or "")
             prev = statuses.get(key)
@@ -486,13 +889,8 @@ def run_strategy_status_monitor(cfg: dict):
                 )
                 print(f"[{now_str()}] Strategy change: name='{name}', instrument='{instrument}', enabled={enabled}, connection='{connection}'")
 
-                # Write JSON snapshot
-                try:
-                    atomic_write_json(status_json_path, statuses_to_json(statuses))
-                    last_json_write = datetime.now()
-                    print(f"Status JSON updated ({len(statuses)} strategies).")
-                except Exception as e:
-                    print(f"[error] Failed to write status JSON: {e}")
+                # Write JSON snapshot (coalesced during bursts)
+                writer.submit(statuses)
 
                 # Publish to Supabase
                 try:
@@ -505,7 +903,7 @@ def run_strategy_status_monitor(cfg: dict):
                 # Optional email on change (rate-limited by cooldown)
                 if email_on_change:
                     can_email = (
-                        last_email_time is None or datetime.now() - last_email_time > timedelta(minutes=cooldown_min)
+                        last_email_time is None or time.monotonic() - last_email_time > cooldown_min * 60
                     )
                     if can_email:
                         try:
@@ -519,7 +917,7 @@ def run_strategy_status_monitor(cfg: dict):
                                 f"Log: {tailer.current}\n"
                             )
                             send_email(cfg["email"], subject, body)
-                            last_email_time = datetime.now()
+                            last_email_time = time.monotonic()
                         except Exception as e:
                             print(f"[error] Email on change failed: {e}")
         except Exception as e:
@@ -528,6 +926,8 @@ def run_strategy_status_monitor(cfg: dict):
 
 def main():
     cfg = load_config()
+    # Unwind normally on SIGTERM so pending snapshot writes are flushed.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
     try:
         run_strategy_status_monitor(cfg)
     except KeyboardInterrupt: